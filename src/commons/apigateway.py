@@ -0,0 +1,74 @@
+import functools
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import boto3
+from aws_lambda_powertools import Logger
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+
+logger = Logger()
+
+MAX_POST_WORKERS = 32
+
+
+@functools.cache
+def get_apigw_client() -> Any:
+    """
+    API Gateway Management client, built once per process.
+
+    The endpoint is resolved by botocore from AWS_ENDPOINT_URL_APIGATEWAYMANAGEMENTAPI
+    (or AWS_ENDPOINT_URL), so every caller posts through the same endpoint.
+    """
+    return boto3.client(
+        "apigatewaymanagementapi",
+        # One keep-alive connection per post worker, so fan-out skips repeat TLS handshakes
+        config=Config(
+            tcp_keepalive=True,
+            max_pool_connections=MAX_POST_WORKERS,
+            retries={"mode": "standard"},
+        ),
+    )
+
+
+def _post_to_connection(client: Any, data: bytes, connection_id: str) -> str | None:
+    """Post data to a single connection, returning the error code on failure."""
+    try:
+        client.post_to_connection(ConnectionId=connection_id, Data=data)
+    except ClientError as exc:
+        error_code: str | None = exc.response.get("Error", {}).get("Code")
+        if error_code != "GoneException":
+            logger.error(
+                "Failed to send message to connection",
+                connection_id=connection_id,
+                error=str(exc),
+                exc_info=True,
+            )
+        return error_code or "Unknown"
+    return None
+
+
+def post_to_connections(
+    client: Any, connection_ids: Sequence[str], data: bytes
+) -> tuple[list[str], list[str]]:
+    """
+    Post data to every connection concurrently.
+
+    Returns:
+        (stale, failed): connections that are gone (410) and connections whose post failed
+    """
+    if not connection_ids:
+        return [], []
+
+    # Posts run concurrently, so a fan-out takes as long as the slowest post
+    with ThreadPoolExecutor(max_workers=min(MAX_POST_WORKERS, len(connection_ids))) as executor:
+        error_codes = executor.map(
+            functools.partial(_post_to_connection, client, data), connection_ids
+        )
+        results = list(zip(connection_ids, error_codes, strict=True))
+
+    stale = [cid for cid, code in results if code == "GoneException"]
+    failed = [cid for cid, code in results if code and code != "GoneException"]
+    return stale, failed
@@ -1,21 +1,109 @@
 import dataclasses
 import enum
+import functools
+import itertools
+import operator
+import random
+import threading
+import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import boto3
 from aws_lambda_powertools import Logger
-from boto3.dynamodb.conditions import Attr, Key
+from boto3.dynamodb.conditions import Attr, ConditionBase, ConditionExpressionBuilder, Key
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from boto3.resources.base import ServiceResource
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from commons.dal.interface import IRepository
-from commons.dynamodb.exceptions import ObjectNotFoundError, RepositoryError
+from commons.dynamodb.exceptions import ConflictError, ObjectNotFoundError, RepositoryError
 
 
 logger = Logger()
 
+BATCH_WRITE_SIZE = 25  # BatchWriteItem limit
+BATCH_GET_SIZE = 100  # BatchGetItem limit
+BATCH_MAX_ATTEMPTS = 5
+BATCH_BACKOFF_SECONDS = 0.1
+
+# Shared by every repository in the container so sockets are kept alive and reused across calls
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "total_max_attempts": 5},
+)
+
+
+@functools.cache
+def _session() -> boto3.session.Session:
+    return boto3.session.Session()
+
+
+@functools.cache
+def _dynamodb_resource() -> ServiceResource:
+    """Single DynamoDB resource (session + connection pool) per Lambda container."""
+    return _session().resource("dynamodb", config=BOTO_CONFIG)
+
+
+@functools.cache
+def _dynamodb_client():
+    """
+    Plain low-level client for hot paths that serialize AttributeValues themselves.
+
+    Not resource.meta.client: that one carries the resource's (de)serialization hooks.
+    """
+    return _session().client("dynamodb", config=BOTO_CONFIG)
+
+
+@functools.cache
+def _dynamodb_table(table_name: str):
+    """Reuse one Table object per table name across repository instances."""
+    return _dynamodb_resource().Table(table_name)
+
+
+@functools.lru_cache(maxsize=128)
+def _projection_expression(projection: tuple[str, ...]) -> tuple[str, dict[str, str]]:
+    """Build ProjectionExpression with name placeholders, which sidesteps reserved words."""
+    names = {f"#p{i}": name for i, name in enumerate(projection)}
+    return ", ".join(names), names
+
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _serialize_value(value: Any) -> dict[str, Any]:
+    """Serialize one attribute, skipping the type walk for the common string case."""
+    if type(value) is str:
+        return {"S": value}
+    return _serializer.serialize(value)
+
+
+def _deserialize_item(item: dict[str, Any]) -> dict[str, Any]:
+    return {name: _deserializer.deserialize(value) for name, value in item.items()}
+
+
+def serialize_item(item: dict[str, Any]) -> dict[str, Any]:
+    """
+    Serialize a plain item (e.g. a model_dump()) to DynamoDB AttributeValues in one pass.
+
+    The result can be written with create(..., raw=True).
+    """
+    return {name: _serialize_value(_coerce(value)) for name, value in item.items()}
+
+
+def _backoff(attempt: int) -> None:
+    time.sleep(BATCH_BACKOFF_SECONDS * (2**attempt + random.random()))
+
+
+def _coerce(value: Any) -> Any:
+    """Store enums by their value."""
+    return value.value if isinstance(value, enum.Enum) else value
+
 
 @dataclasses.dataclass
 class DynamoDBRepository(IRepository):
@@ -35,47 +123,289 @@ class DynamoDBRepository(IRepository):
     def table_primary_key(self) -> str:
         return self.table_hash_key
 
-    resource: ServiceResource = dataclasses.field(init=False)
     key_auto_assign: bool = True
-    key_factory: Callable = lambda: str(uuid.uuid4())
+    # uuid4 hex (no dashes); pass key_factory=secrets.token_hex for write-heavy tables
+    key_factory: Callable[[], str] = lambda: uuid.uuid4().hex
+    scan_segments: int = 1
+    cache_ttl: float = 0
+    cache_maxsize: int = 10_000
 
     def __post_init__(self):
-        self.resource = boto3.resource("dynamodb")
-        self.table = self.resource.Table(self.table_name)
+        # boto3 objects are created on first use (see the cached properties below), so
+        # importing the module-level repositories does not load botocore service data
+        self._hash_key_obj = Key(self.table_hash_key)
+        self._sort_key_obj = Key(self.table_sort_key) if self.table_sort_key else None
+        self._primary_keys = [self.table_hash_key]
+        if self.table_sort_key:
+            self._primary_keys.append(self.table_sort_key)
+        # Read-aside cache of full-key gets, primary key values -> (expires_at, item)
+        self._cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+        # Full-key gets currently on the wire, so concurrent callers share one GetItem
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._update_expr_cache: dict[frozenset[str], tuple[str, dict[str, str]]] = {}
+
+    @functools.cached_property
+    def resource(self) -> ServiceResource:
+        return _dynamodb_resource()
+
+    @functools.cached_property
+    def table(self):
+        return _dynamodb_table(self.table_name)
+
+    @functools.cached_property
+    def _client(self):
+        return _dynamodb_client()
 
     def _assign_key(self, item: dict):
         """Auto-assign primary key if key_auto_assign is enabled."""
         item[self.table_hash_key] = self.key_factory()
 
-    def create(self, item: dict[str, Any]) -> dict[str, Any]:
+    def _cache_key(self, keys: dict[str, Any]) -> tuple:
+        return tuple(keys.get(name) for name in self._primary_keys)
+
+    def _cache_get(self, cache_key: tuple) -> dict[str, Any] | None:
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            return None
+        expires_at, item = cached
+        if expires_at < time.monotonic():
+            self._cache.pop(cache_key, None)
+            return None
+        return item
+
+    def _cache_set(self, cache_key: tuple, item: dict[str, Any]) -> None:
+        if len(self._cache) >= self.cache_maxsize:
+            # dicts keep insertion order, so this evicts the oldest entry
+            self._cache.pop(next(iter(self._cache)), None)
+        self._cache[cache_key] = (time.monotonic() + self.cache_ttl, item)
+
+    def _invalidate(self, keys: dict[str, Any]) -> None:
+        if self._cache:
+            self._cache.pop(self._cache_key(keys), None)
+
+    def _single_flight(self, flight_key: tuple, func: Callable[[], Any]) -> Any:
+        """Run func once per flight_key at a time; concurrent callers wait for its result."""
+        with self._inflight_lock:
+            future = self._inflight.get(flight_key)
+            is_leader = future is None
+            if is_leader:
+                future = self._inflight[flight_key] = Future()
+
+        if is_leader:
+            try:
+                future.set_result(func())
+            except BaseException as err:
+                future.set_exception(err)
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[flight_key]
+        return future.result()
+
+    def create(
+        self,
+        item: dict[str, Any],
+        *,
+        raw: bool = False,
+        unique: bool = False,
+        condition: ConditionBase | None = None,
+    ) -> dict[str, Any]:
         """
         Create a new item in DynamoDB.
 
         Auto-assigns the primary key if key_auto_assign is enabled and
         the key is not already present in the item.
+
+        With raw=True the item is already AttributeValue-shaped (see serialize_item)
+        and is written as-is through the low-level client. With unique=True the put
+        only succeeds if no item with the same key exists, so callers get
+        create-if-absent without reading first. condition adds any other
+        ConditionExpression; a failed condition raises ConflictError.
         """
         # auto assign "table_hash_key" value using "key_auto_assign" in case it's enabled
         if self.key_auto_assign and item.get(self.table_hash_key) is None:
             self._assign_key(item)
-
-        self.try_except(func=self.table.put_item, Item=item)
+            if raw:
+                item[self.table_hash_key] = {"S": item[self.table_hash_key]}
+
+        if unique:
+            not_exists = Attr(self.table_hash_key).not_exists()
+            condition = not_exists if condition is None else not_exists & condition
+
+        put_kwargs = {}
+        if raw:
+            if condition is not None:
+                put_kwargs = self._client_expressions(put_kwargs, ConditionExpression=condition)
+            if self._cache:
+                self._invalidate(_deserialize_item({k: item[k] for k in self._primary_keys}))
+            self.try_except(
+                func=self._client.put_item, TableName=self.table_name, Item=item, **put_kwargs
+            )
+        else:
+            if condition is not None:
+                put_kwargs["ConditionExpression"] = condition
+            self._invalidate(item)
+            self.try_except(func=self.table.put_item, Item=item, **put_kwargs)
         return item
 
-    def _get_item_by_full_key(self, keys: dict[str, Any]) -> dict[str, Any] | None:
-        """Fetch a single item via get_item using the full primary key."""
+    def batch_create(self, items: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Create many items with BatchWriteItem, 25 items per request.
+
+        Keys are auto-assigned as in create(). Items left unprocessed (partial
+        throttling) are resent with exponential backoff; RepositoryError is raised
+        if some are still unprocessed after BATCH_MAX_ATTEMPTS requests.
+        """
+        items = list(items)
+        if self.key_auto_assign:
+            hash_key, key_factory = self.table_hash_key, self.key_factory
+            for item in items:
+                if item.get(hash_key) is None:
+                    item[hash_key] = key_factory()
+
+        if self._cache:
+            for item in items:
+                self._invalidate(item)
+
+        # A key repeated within one request fails the whole call, so the last write wins
+        unique_items = {self._cache_key(item): item for item in items}
+        requests = [
+            {"PutRequest": {"Item": serialize_item(item)}} for item in unique_items.values()
+        ]
+        for chunk in itertools.batched(requests, BATCH_WRITE_SIZE):
+            self._batch_write_chunk(chunk)
+        return items
+
+    def _batch_write_chunk(self, chunk: tuple[dict[str, Any], ...]) -> None:
+        """Run one BatchWriteItem, resending UnprocessedItems with exponential backoff."""
+        requests = list(chunk)
+        for attempt in range(BATCH_MAX_ATTEMPTS):
+            response = self.try_except(
+                func=self._client.batch_write_item, RequestItems={self.table_name: requests}
+            )
+            requests = response.get("UnprocessedItems", {}).get(self.table_name)
+            if not requests:
+                return
+            if attempt < BATCH_MAX_ATTEMPTS - 1:
+                _backoff(attempt)
+
+        msg = (
+            f"BatchWriteItem left {len(requests)} items unprocessed for "
+            f"'{self.table_name=}' after {BATCH_MAX_ATTEMPTS} attempts"
+        )
+        logger.error(msg)
+        raise RepositoryError(msg)
+
+    @staticmethod
+    def _projection_kwargs(projection: tuple[str, ...] | None) -> dict[str, Any]:
+        if not projection:
+            return {}
+        projection_expression, names = _projection_expression(tuple(projection))
+        # boto3 merges generated placeholders into this dict, so never hand out the cached one
+        return {
+            "ProjectionExpression": projection_expression,
+            "ExpressionAttributeNames": dict(names),
+        }
+
+    def _get_item_by_full_key(
+        self,
+        keys: dict[str, Any],
+        projection: tuple[str, ...] | None = None,
+        raw: bool = False,
+    ) -> dict[str, Any] | None:
+        """
+        Fetch a single item via get_item using the full primary key.
+
+        Goes through the low-level client with the key serialized here, which skips
+        the Table resource's per-request parameter transformation.
+        """
         key_dict = {self.table_hash_key: keys[self.table_hash_key]}
 
         if self.table_sort_key and self.table_sort_key in keys:
             key_dict[self.table_sort_key] = keys[self.table_sort_key]
 
-        result = self.try_except(func=self.table.get_item, Key=key_dict)
-        return result.get("Item") if result else None
+        cache_key = self._cache_key(key_dict)
+        use_cache = self.cache_ttl and not projection and not raw
+        if use_cache:
+            item = self._cache_get(cache_key)
+            if item is not None:
+                return dict(item)
+
+        def get_item() -> dict[str, Any] | None:
+            result = self.try_except(
+                func=self._client.get_item,
+                TableName=self.table_name,
+                Key={name: _serialize_value(value) for name, value in key_dict.items()},
+                **self._projection_kwargs(projection),
+            )
+            item = result.get("Item") if result else None
+            if item is not None and not raw:
+                item = _deserialize_item(item)
+            if use_cache and item is not None:
+                self._cache_set(cache_key, item)
+            return item
+
+        item = self._single_flight((*cache_key, projection, raw), get_item)
+        # The cache and concurrent callers share the fetched dict; hand each caller its own
+        return dict(item) if item is not None else None
+
+    def get_many(
+        self, keys: Iterable[dict[str, Any]], *, projection: tuple[str, ...] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch many items by full primary key with BatchGetItem, 100 keys per request.
+
+        Chunks are fetched concurrently. Items come back in no particular order and
+        keys that do not exist are simply missing from the result.
+        """
+        unique_keys = {self._cache_key(key): key for key in keys}
+        serialized = [
+            {name: _serialize_value(key[name]) for name in self._primary_keys}
+            for key in unique_keys.values()
+        ]
+        chunks = list(itertools.batched(serialized, BATCH_GET_SIZE))
+        if len(chunks) <= 1:
+            return self._batch_get_chunk(chunks[0], projection) if chunks else []
+
+        max_workers = min(len(chunks), BOTO_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = executor.map(
+                functools.partial(self._batch_get_chunk, projection=projection), chunks
+            )
+            return list(itertools.chain.from_iterable(pages))
+
+    def _batch_get_chunk(
+        self, chunk: tuple[dict[str, Any], ...], projection: tuple[str, ...] | None = None
+    ) -> list[dict[str, Any]]:
+        """Run one BatchGetItem, resending UnprocessedKeys with exponential backoff."""
+        request = {"Keys": list(chunk), **self._projection_kwargs(projection)}
+        items = []
+        for attempt in range(BATCH_MAX_ATTEMPTS):
+            response = self.try_except(
+                func=self._client.batch_get_item, RequestItems={self.table_name: request}
+            )
+            items.extend(response["Responses"].get(self.table_name, []))
+            unprocessed = response.get("UnprocessedKeys", {}).get(self.table_name)
+            if not unprocessed:
+                return [_deserialize_item(item) for item in items]
+            request = unprocessed
+            if attempt < BATCH_MAX_ATTEMPTS - 1:
+                _backoff(attempt)
+
+        msg = (
+            f"BatchGetItem left {len(request['Keys'])} keys unprocessed for "
+            f"'{self.table_name=}' after {BATCH_MAX_ATTEMPTS} attempts"
+        )
+        logger.error(msg)
+        raise RepositoryError(msg)
 
     def _query_by_partition(
         self,
         keys: dict[str, Any],
         filter_attributes: dict[str, Any] | None,
         limit: int | None = 1,
+        projection: tuple[str, ...] | None = None,
+        raw: bool = False,
     ) -> list[dict[str, Any]] | None:
         """Query a partition (optionally with sort key and filters) and return first match."""
         partition_value = keys.get(self.table_hash_key)
@@ -84,53 +414,99 @@ class DynamoDBRepository(IRepository):
                 f"Missing partition key '{self.table_hash_key}' for get_by_key"
             )
 
-        key_condition = Key(self.table_hash_key).eq(partition_value)
-        if self.table_sort_key and self.table_sort_key in keys:
-            key_condition = key_condition & Key(self.table_sort_key).eq(
-                keys[self.table_sort_key]
-            )
+        key_condition = self._hash_key_obj.eq(partition_value)
+        if self._sort_key_obj is not None and self.table_sort_key in keys:
+            key_condition = key_condition & self._sort_key_obj.eq(keys[self.table_sort_key])
 
-        filter_expression = None
+        query_kwargs = self._projection_kwargs(projection)
         if filter_attributes:
-            for name, value in filter_attributes.items():
-                expr = Attr(name).eq(value)
-                filter_expression = (
-                    expr if filter_expression is None else filter_expression & expr
-                )
-
-        response = self.try_except(
-            func=self.table.query,
-            KeyConditionExpression=key_condition,
-            FilterExpression=filter_expression,
-            Limit=limit,
-        )
+            query_kwargs["FilterExpression"] = functools.reduce(
+                operator.and_,
+                (Attr(name).eq(value) for name, value in filter_attributes.items()),
+            )
+        if limit:
+            query_kwargs["Limit"] = limit
+
+        if raw:
+            response = self.try_except(
+                func=self._client.query,
+                TableName=self.table_name,
+                **self._client_expressions(query_kwargs, KeyConditionExpression=key_condition),
+            )
+        else:
+            response = self.try_except(
+                func=self.table.query, KeyConditionExpression=key_condition, **query_kwargs
+            )
         items = response.get("Items", [])
         return items if items else None
 
+    @staticmethod
+    def _client_expressions(
+        params: dict[str, Any], **conditions: ConditionBase
+    ) -> dict[str, Any]:
+        """
+        Render boto3 condition objects into the string expressions the low-level client takes.
+
+        The resource does this on every call; raw reads have to do it themselves.
+        """
+        if "FilterExpression" in params:
+            conditions["FilterExpression"] = params.pop("FilterExpression")
+
+        builder = ConditionExpressionBuilder()
+        names = params.pop("ExpressionAttributeNames", {})
+        values = {}
+        for param, condition in conditions.items():
+            built = builder.build_expression(
+                condition, is_key_condition=param == "KeyConditionExpression"
+            )
+            params[param] = built.condition_expression
+            names.update(built.attribute_name_placeholders)
+            values.update(built.attribute_value_placeholders)
+
+        # The client rejects empty placeholder maps (e.g. for attribute_not_exists)
+        if names:
+            params["ExpressionAttributeNames"] = names
+        if values:
+            params["ExpressionAttributeValues"] = {
+                placeholder: _serialize_value(value) for placeholder, value in values.items()
+            }
+        return params
+
     def get_by_key(
         self,
         *,
         raise_not_found: bool = True,
         filter_attributes: dict[str, Any] | None = None,
         limit: int | None = 1,
+        projection: Iterable[str] | None = None,
+        raw: bool = False,
         **keys,
     ) -> dict[str, Any] | None:
         """
         Flexible get that supports:
         - direct get_item when full key is provided
         - partition-only query (optionally filtered) when sort key is omitted
+
+        Pass projection to fetch only those attributes instead of the whole item.
+        With cache_ttl set, full-key gets are served from an in-process cache for
+        that many seconds; writes through this repository invalidate the entry. Each
+        call gets its own (shallow) copy of the item, so callers may modify it.
+        With raw=True the item is returned as DynamoDB AttributeValues, undeserialized,
+        for callers that only pass it through.
         """
         if not self.table_hash_key:
             raise ValueError("table_hash_key must be configured")
+        # Hashable and order-preserving, for the single-flight key and the expression cache
+        projection = tuple(projection) if projection else None
 
         has_hash = self.table_hash_key in keys
         has_sort = self.table_sort_key and self.table_sort_key in keys
         provides_full_key = has_hash and (not self.table_sort_key or has_sort)
 
         if provides_full_key:
-            item = self._get_item_by_full_key(keys)
+            item = self._get_item_by_full_key(keys, projection, raw)
         else:
-            item = self._query_by_partition(keys, filter_attributes, limit)
+            item = self._query_by_partition(keys, filter_attributes, limit, projection, raw)
             item = item[0] if item else None
 
         if item:
@@ -139,60 +515,175 @@ class DynamoDBRepository(IRepository):
             raise ObjectNotFoundError(f"Object {keys} was not found")
         return None
 
-    def get_list(self) -> list[dict[str, Any]]:
-        """Get all items from the DynamoDB table using scan operation."""
-        response = self.try_except(func=self.table.scan)
-        return response.get("Items", [])
+    def query_by_partition(
+        self,
+        pk_value: Any,
+        *,
+        sort_asc: bool = True,
+        limit: int | None = None,
+        projection: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get every item in one partition, ordered by the sort key.
+
+        DynamoDB reads only that partition and returns it already sorted, paging
+        past the 1 MB query limit until `limit` items (or all of them) are read.
+        With a projection only those attributes are returned.
+        """
+        query_kwargs = self._projection_kwargs(tuple(projection) if projection else None)
+        query_kwargs.update(
+            KeyConditionExpression=self._hash_key_obj.eq(pk_value),
+            ScanIndexForward=sort_asc,
+        )
+        items: list[dict[str, Any]] = []
+        while True:
+            if limit:
+                query_kwargs["Limit"] = limit - len(items)
+            response = self.try_except(func=self.table.query, **query_kwargs)
+            items.extend(response.get("Items", []))
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key or (limit and len(items) >= limit):
+                return items
+            query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+    def _iter_segment(
+        self, segment: int | None = None, total_segments: int | None = None, raw: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        """Yield items from one scan segment (or the whole table), page by page."""
+        scan, scan_kwargs = self.table.scan, {}
+        if raw:
+            scan, scan_kwargs = self._client.scan, {"TableName": self.table_name}
+        if total_segments:
+            scan_kwargs.update(Segment=segment, TotalSegments=total_segments)
+
+        while True:
+            response = self.try_except(func=scan, **scan_kwargs)
+            yield from response.get("Items", [])
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key:
+                return
+            scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+    def _scan_segment(
+        self, segment: int, total_segments: int, raw: bool = False
+    ) -> list[dict[str, Any]]:
+        return list(self._iter_segment(segment, total_segments, raw))
+
+    def iter_all(self, *, raw: bool = False) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterate over every item in the table.
+
+        Only one scan page (up to 1 MB) is held in memory at a time, so callers
+        that stream or aggregate items never materialize the whole table.
+        """
+        return self._iter_segment(raw=raw)
+
+    def get_list(
+        self, *, total_segments: int | None = None, raw: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Get all items from the DynamoDB table using scan operation.
+
+        Pages past the 1 MB scan limit. With more than one segment (defaults to
+        scan_segments) the table is scanned as a parallel scan, one thread per
+        segment, capped at the shared connection pool size. With raw=True items
+        are returned as DynamoDB AttributeValues straight from the low-level client.
+        """
+        total_segments = min(
+            total_segments or self.scan_segments, BOTO_CONFIG.max_pool_connections
+        )
+        if total_segments <= 1:
+            return list(self.iter_all(raw=raw))
+
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            segments = executor.map(
+                functools.partial(
+                    self._scan_segment, total_segments=total_segments, raw=raw
+                ),
+                range(total_segments),
+            )
+            return list(itertools.chain.from_iterable(segments))
 
-    def update(self, params: dict[str, Any], **keys) -> None:
+    def update(
+        self, params: dict[str, Any], *, condition: ConditionBase | None = None, **keys
+    ) -> None:
         """
         Update an existing item in DynamoDB.
 
         Automatically handles enum serialization and prevents updating primary keys.
+        A condition that does not hold raises ConflictError and leaves the item as is.
         """
-        update_clauses = []
-        expression_attribute_values = {}
-        expression_attribute_names = {}
-
-        for name, value in params.items():
-            if name == self.table_hash_key or (
-                self.table_sort_key and name == self.table_sort_key
-            ):
-                continue
-            if isinstance(value, enum.Enum):
-                value = value.value
-            update_clauses.append(f"#{name} = :{name}")
-            expression_attribute_values[f":{name}"] = value
-            expression_attribute_names[f"#{name}"] = name
-        update_expression = "SET " + ", ".join(update_clauses)
+        schema = frozenset(name for name in params if name not in self._primary_keys)
+        update_expression, expression_attribute_names = self._update_expression(schema)
+        expression_attribute_values = {f":{name}": _coerce(params[name]) for name in schema}
 
+        update_kwargs = {}
+        if condition is not None:
+            update_kwargs["ConditionExpression"] = condition
+
+        self._invalidate(keys)
         self.try_except(
             func=self.table.update_item,
             Key=keys,
             UpdateExpression=update_expression,
             ExpressionAttributeValues=expression_attribute_values,
-            ExpressionAttributeNames=expression_attribute_names,
+            ExpressionAttributeNames=dict(expression_attribute_names),
             ReturnValues="ALL_NEW",
+            **update_kwargs,
         )
 
-    def delete(self, **keys) -> None:
-        """Delete an item from DynamoDB by its primary key(s)."""
+    def _update_expression(self, schema: frozenset[str]) -> tuple[str, dict[str, str]]:
+        """Return the SET expression and attribute names for these fields, built once each."""
+        cached = self._update_expr_cache.get(schema)
+        if cached is None:
+            names = sorted(schema)
+            update_expression = "SET " + ", ".join(f"#{name} = :{name}" for name in names)
+            cached = update_expression, {f"#{name}": name for name in names}
+            self._update_expr_cache[schema] = cached
+        return cached
+
+    def delete(self, *, condition: ConditionBase | None = None, **keys) -> None:
+        """
+        Delete an item from DynamoDB by its primary key(s).
+
+        A condition that does not hold raises ConflictError and keeps the item.
+        """
+        delete_kwargs = {}
+        if condition is not None:
+            delete_kwargs["ConditionExpression"] = condition
+
+        self._invalidate(keys)
         self.try_except(
             func=self.table.delete_item,
             Key=keys,
+            **delete_kwargs,
         )
 
+    def batch_delete(self, keys: Iterable[dict[str, Any]]) -> None:
+        """Delete many items, grouped into BatchWriteItem requests of up to 25 keys."""
+
+        def batch_delete_item():
+            # A key repeated within one request would fail the whole BatchWriteItem
+            with self.table.batch_writer(overwrite_by_pkeys=self._primary_keys) as writer:
+                for key in keys:
+                    self._invalidate(key)
+                    writer.delete_item(Key=key)
+
+        self.try_except(func=batch_delete_item)
+
     # DynamoDB-specific methods (not part of interface, but preserved for backward compatibility)
     def search(self, *, params: dict, limit) -> list[dict]:
         """DynamoDB-specific search method (not part of interface)."""
         raise NotImplementedError
 
-    def search_in_secondary_index(
-        self, *, index_name: str, field, value
-    ) -> list[dict] | None:
-        """Query DynamoDB using a secondary index (not part of interface)."""
-        response = self.table.query(
-            IndexName=index_name, KeyConditionExpression=Key(field).eq(value)
+    def search_in_secondary_index(self, *, index_name: str, field, value) -> dict | None:
+        """Return the first item matching field == value on a secondary index."""
+        response = self.try_except(
+            func=self.table.query,
+            IndexName=index_name,
+            KeyConditionExpression=Key(field).eq(value),
+            Select="ALL_PROJECTED_ATTRIBUTES",
+            Limit=1,
         )
 
         items = response.get("Items", [])
@@ -200,6 +691,21 @@ class DynamoDBRepository(IRepository):
             return items[0]
         return None
 
+    def iter_secondary_index(self, *, index_name: str, field, value) -> Iterator[dict]:
+        """Lazily yield every item matching field == value on a secondary index, page by page."""
+        query_kwargs = {
+            "IndexName": index_name,
+            "KeyConditionExpression": Key(field).eq(value),
+            "Select": "ALL_PROJECTED_ATTRIBUTES",
+        }
+        while True:
+            response = self.try_except(func=self.table.query, **query_kwargs)
+            yield from response.get("Items", [])
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key:
+                return
+            query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
     def try_except(self, func: callable, *args, **kwargs):
         """
         Wrapper for DynamoDB operations that handles exceptions and converts
@@ -209,7 +715,13 @@ class DynamoDBRepository(IRepository):
             return func(*args, **kwargs)
         except ClientError as err:
             msg = f"Error while calling '{func.__name__}' for '{self.table_name=}'. Reason: {err.response['Error']}"
-            logger.error(msg, stack_info=True)
+            if err.response["Error"].get("Code") == "ConditionalCheckFailedException":
+                # An expected outcome of a conditional write, not a failure of the call
+                logger.info(msg)
+                raise ConflictError(msg) from err
+            # Service errors such as throttling can come in storms; the traceback of the
+            # failing call is enough, skip formatting the whole caller stack
+            logger.error(msg, exc_info=True)
             raise RepositoryError(msg) from err
         except Exception as err:
             msg = f"Error while calling '{func.__name__}' for '{self.table_name=}'. Reason: {err}"
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any
 
 
@@ -74,6 +75,52 @@ class IRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def query_by_partition(
+        self,
+        pk_value: Any,
+        *,
+        sort_asc: bool = True,
+        limit: int | None = None,
+        projection: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get all items sharing a partition key, ordered by the sort key.
+
+        Args:
+            pk_value: Partition key value to read
+            sort_asc: If True, return items in ascending sort key order, else descending
+            limit: Maximum number of items to return (None for all)
+            projection: Attribute names to return (None for whole items)
+
+        Returns:
+            List of dictionaries, each representing a database record
+
+        Raises:
+            RepositoryError: If the retrieval operation fails
+        """
+        pass
+
+    @abstractmethod
+    def search_in_secondary_index(
+        self, *, index_name: str, field: str, value: Any
+    ) -> dict[str, Any] | None:
+        """
+        Get the first item whose field matches value on a secondary index.
+
+        Args:
+            index_name: Name of the secondary index keyed by field
+            field: Index key attribute name
+            value: Index key value to look up
+
+        Returns:
+            Dictionary representing the database record, or None if no item matches
+
+        Raises:
+            RepositoryError: If the retrieval operation fails
+        """
+        pass
+
     @abstractmethod
     def update(self, params: dict[str, Any], **keys) -> None:
         """
@@ -102,3 +149,16 @@ class IRepository(ABC):
             RepositoryError: If the deletion operation fails
         """
         pass
+
+    @abstractmethod
+    def batch_delete(self, keys: Iterable[dict[str, Any]]) -> None:
+        """
+        Delete many items at once.
+
+        Args:
+            keys: Primary key dictionaries, one per item to delete
+
+        Raises:
+            RepositoryError: If the deletion operation fails
+        """
+        pass
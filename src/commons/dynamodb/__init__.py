@@ -1,6 +1,7 @@
-from commons.dynamodb.exceptions import ObjectNotFoundError, RepositoryError
+from commons.dynamodb.exceptions import ConflictError, ObjectNotFoundError, RepositoryError
 
 __all__ = [
+    "ConflictError",
     "ObjectNotFoundError",
     "RepositoryError",
 ]
@@ -4,3 +4,7 @@ class RepositoryError(Exception):
 
 class ObjectNotFoundError(RepositoryError):
     pass
+
+
+class ConflictError(RepositoryError):
+    pass
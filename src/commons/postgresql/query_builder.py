@@ -18,6 +18,9 @@ class QueryBuilder:
     search_operators: typing.Optional[dict[str, str]] = dataclasses.field(default_factory=dict)
     initial_sql: str = dataclasses.field(init=False)
     initial_count_sql: str = dataclasses.field(init=False)
+    _sql_cache: dict[tuple, tuple[str, str]] = dataclasses.field(
+        init=False, default_factory=dict, repr=False
+    )
 
     def __post_init__(self):
         select_ = ", ".join(self.select_columns)
@@ -25,6 +28,23 @@ class QueryBuilder:
         self.initial_sql = f"SELECT {select_}\n FROM {from_}\n"
         self.initial_count_sql = f"SELECT COUNT(*) as total\n FROM {from_}\n"
 
+    def _condition(self, key: str) -> str:
+        search_column = self.search_aliases.get(key, key)
+        search_operator = self.search_operators.get(key, "=")
+        return f"{search_column} {search_operator} %({key})s"
+
+    @staticmethod
+    def _cache_key(params: typing.Optional[dict], limit: typing.Optional[int]) -> tuple:
+        """Key a compiled query by the shape of its params (non-None keys) and paging."""
+        if params is None:
+            return None, bool(limit)
+        return frozenset(k for k, v in params.items() if v is not None), bool(limit)
+
+    @staticmethod
+    def _paginate(new_params: dict, limit: typing.Optional[int], offset: typing.Optional[int]):
+        if limit:
+            new_params.update({"limit_param": limit, "offset_param": offset or 0})
+
     def build_sql_query(
         self,
         params: dict,
@@ -32,39 +52,8 @@ class QueryBuilder:
         offset: typing.Optional[int] = 0,
     ) -> tuple[str, dict]:
         new_params = (params or {}).copy()
-        sql = self.initial_sql
-
-        if self.join:
-            joins = []
-            for j, t, c in self.join:
-                joins.append(f"{j} JOIN {t} on ({c})")
-            joins = " ".join(joins)
-            sql = f"{sql} {joins}"
-
-        if params is not None:
-            conditions = self.where_conditions.copy()
-            for key, _value in params.items():
-                if _value is None:
-                    continue
-                search_column = self.search_aliases.get(key, key)
-                search_operator = self.search_operators.get(key, "=")
-                conditions.append(f"{search_column} {search_operator} %({key})s")
-            if conditions:
-                where_clause = " AND ".join(conditions)
-                sql = f"{sql} WHERE {where_clause}"
-
-        if self.group_by:
-            group_by_clause = ", ".join(self.group_by)
-            sql = f"{sql} GROUP BY {group_by_clause}"
-
-        if self.order_by:
-            order_by_clause = ", ".join(self.order_by)
-            sql = f"{sql} ORDER BY {order_by_clause}"
-
-        if limit:
-            new_params.update({"limit_param": limit, "offset_param": offset or 0})
-            sql = f"{sql} LIMIT %(limit_param)s OFFSET %(offset_param)s"
-
+        sql, _ = self._compiled(params, limit)
+        self._paginate(new_params, limit, offset)
         return sql, new_params
 
     def build_sql_with_count_query(
@@ -74,41 +63,49 @@ class QueryBuilder:
         offset: typing.Optional[int] = 0,
     ) -> tuple[str, str, dict]:
         new_params = (params or {}).copy()
-        sql = self.initial_sql
-        sql_count = self.initial_count_sql
+        sql, sql_count = self._compiled(params, limit)
+        self._paginate(new_params, limit, offset)
+        return sql, sql_count, new_params
+
+    def _compiled(
+        self, params: typing.Optional[dict], limit: typing.Optional[int]
+    ) -> tuple[str, str]:
+        """Return the (select, count) SQL for this params shape, compiling it on first use."""
+        cache_key = self._cache_key(params, limit)
+        compiled = self._sql_cache.get(cache_key)
+        if compiled is None:
+            keys, limit_is_set = cache_key
+            compiled = self._compile(keys, limit_is_set)
+            self._sql_cache[cache_key] = compiled
+        return compiled
+
+    def _compile(self, keys: typing.Optional[frozenset], limit_is_set: bool) -> tuple[str, str]:
+        parts = [self.initial_sql]
+        count_parts = [self.initial_count_sql]
 
         if self.join:
-            joins = []
-            for j, t, c in self.join:
-                joins.append(f"{j} JOIN {t} on ({c})")
-            joins = " ".join(joins)
-            sql = f"{sql} {joins}"
-            sql_count = f"{sql} {joins}"
-
-        if params is not None:
+            joins = " ".join(f"{j} JOIN {t} on ({c})" for j, t, c in self.join)
+            parts.append(f" {joins}")
+            count_parts.append(f" {joins}")
+
+        if keys is not None:
             conditions = self.where_conditions.copy()
-            for key, _value in params.items():
-                if _value is None:
-                    continue
-                search_column = self.search_aliases.get(key, key)
-                search_operator = self.search_operators.get(key, "=")
-                conditions.append(f"{search_column} {search_operator} %({key})s")
+            conditions.extend(self._condition(key) for key in sorted(keys))
             if conditions:
                 where_clause = " AND ".join(conditions)
-                sql = f"{sql} WHERE {where_clause}"
-                sql_count = f"{sql} WHERE {where_clause}"
+                parts.append(f" WHERE {where_clause}")
+                count_parts.append(f" WHERE {where_clause}")
 
         if self.group_by:
             group_by_clause = ", ".join(self.group_by)
-            sql = f"{sql} GROUP BY {group_by_clause}"
-            sql_count = f"{sql} GROUP BY {group_by_clause}"
+            parts.append(f" GROUP BY {group_by_clause}")
+            count_parts.append(f" GROUP BY {group_by_clause}")
 
         if self.order_by:
             order_by_clause = ", ".join(self.order_by)
-            sql = f"{sql} ORDER BY {order_by_clause}"
+            parts.append(f" ORDER BY {order_by_clause}")
 
-        if limit:
-            new_params.update({"limit_param": limit, "offset_param": offset or 0})
-            sql = f"{sql} LIMIT %(limit_param)s OFFSET %(offset_param)s"
+        if limit_is_set:
+            parts.append(" LIMIT %(limit_param)s OFFSET %(offset_param)s")
 
-        return sql, sql_count, new_params
+        return "".join(parts), "".join(count_parts)
@@ -6,6 +6,8 @@ from commons.dal import DynamoDBRepository
 class Settings(BaseSettings):
     # DynamoDB configuration
     chat_events_table_idempotency_key: str = "id"
+    # GSI keyed by chat_events_table_idempotency_key, for duplicate lookups
+    chat_events_table_id_index: str = "MessageIdIndex"
     chat_events_table_name: str = "chat_events"
     chat_events_table_pk: str = "channel_id"
     chat_events_table_sk: str = "ts"
@@ -13,6 +15,9 @@ class Settings(BaseSettings):
     connections_table_name: str = "connections"
     connections_table_pk: str = "connectionId"
     connections_table_idempotency_key: str = "connectionId"
+    # Parallel scan only pays off once the table spans many pages; set
+    # CONNECTIONS_TABLE_SCAN_SEGMENTS to enable it for large deployments
+    connections_table_scan_segments: int = 1
 
 
 settings = Settings()
@@ -23,12 +28,13 @@ connections_repo = DynamoDBRepository(
     table_hash_key=settings.connections_table_pk,
     table_idempotency_key=settings.connections_table_pk,
     key_auto_assign=True,
+    scan_segments=settings.connections_table_scan_segments,
 )
 
 chat_events_repository = DynamoDBRepository(
     table_name=settings.chat_events_table_name,
     table_hash_key=settings.chat_events_table_pk,
     table_sort_key=settings.chat_events_table_sk,
-    table_idempotency_key=settings.chat_events_table_pk,
+    table_idempotency_key=settings.chat_events_table_idempotency_key,
     key_auto_assign=True,
 )
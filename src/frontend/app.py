@@ -1,5 +1,7 @@
 import asyncio
+import collections
 import json
+from collections.abc import Iterable
 from contextlib import suppress
 from typing import Any
 from uuid import uuid4
@@ -7,30 +9,116 @@ from uuid import uuid4
 import aiohttp
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
 
 from commons.schemas import ChatEventMessage
 
 from .config import API_BASE_URL, WS_CONN, logger
 
 
+try:
+    import uvloop
+except ImportError:  # optional speed-up, the default asyncio loop works the same
+    uvloop = None
+
+# Loop factory for the consumer's asyncio.run(); None keeps asyncio's default loop
+_LOOP_FACTORY = uvloop.new_event_loop if uvloop is not None else None
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# (connect, read) seconds for REST calls; the read allows for a cold Lambda behind the API
+_HTTP_TIMEOUT = (2, 15)
+
+# Chat history kept (and replayed) per session; older messages fall off the front
+_MAX_MESSAGES = 500
+
+# API Gateway WebSocket APIs cap messages at 128 KiB; nothing larger is legitimate
+_MAX_WS_MESSAGE_SIZE = 128 * 1024
+
+# Text whose first non-whitespace character is not one of these is plain text, not JSON
+_JSON_OPENERS = frozenset('{["')
+_JSON_WHITESPACE = " \t\n\r"
+
+_CANONICAL_KEYS = frozenset(("content", "sender", "channel", "role"))
+
+_BINARY_MESSAGE = {
+    "content": "<binary>",
+    "sender": "server",
+    "channel": "default-room",
+    "role": "assistant",
+}
+
+
+@st.cache_resource
+def _http_session() -> requests.Session:
+    """Keep-alive HTTP session shared by every rerun, so sends reuse one connection."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _set_history(messages: Iterable[dict[str, Any]] = ()) -> None:
+    """Replace the chat history and the set of message ids it contains.
+
+    The history is bounded, so memory and history replay stay capped in long sessions.
+    """
+    st.session_state.messages = collections.deque(messages, maxlen=_MAX_MESSAGES)
+    # Insertion-ordered, so the oldest ids can be dropped along with their messages
+    st.session_state.seen_ids = dict.fromkeys(
+        message["id"] for message in st.session_state.messages if message.get("id")
+    )
+
+
+def _is_new(message: dict[str, Any]) -> bool:
+    """Record the message id; False if that id was already seen (e.g. our own echo).
+
+    Only the newest _MAX_MESSAGES ids are kept, the same bound as the history itself.
+    """
+    message_id = message.get("id")
+    if not message_id:
+        return True
+    seen_ids = st.session_state.seen_ids
+    if message_id in seen_ids:
+        return False
+    seen_ids[message_id] = None
+    if len(seen_ids) > _MAX_MESSAGES:
+        del seen_ids[next(iter(seen_ids))]
+    return True
+
+
 def _init_state() -> None:
     """Initialize session state defaults."""
     logger.debug(f"[-]{ API_BASE_URL=},\n\t{ WS_CONN=}")
 
-    st.session_state.setdefault("messages", [])
+    if "messages" not in st.session_state:
+        _set_history()
     st.session_state.setdefault("connected", False)
     st.session_state.setdefault("channel_id", "default-room")
     st.session_state.setdefault("connect_requested", False)
     st.session_state.setdefault("disconnect_requested", False)
     st.session_state.setdefault("ws_client", None)
+    if "default_display_name" not in st.session_state:
+        st.session_state.default_display_name = uuid4().hex[:8]
+
+
+def _may_be_json(text: str) -> bool:
+    """False only for text that cannot be a JSON object, array or string."""
+    # lstrip returns text itself (no copy) when there is no leading whitespace
+    return text.lstrip(_JSON_WHITESPACE)[:1] in _JSON_OPENERS
 
 
 def _extract_message(payload: Any) -> dict[str, Any]:
     """Normalize inbound payloads into a chat message dict."""
     if isinstance(payload, str):
         try:
-            payload = json.loads(payload)
+            if _may_be_json(payload):
+                payload = json.loads(payload)
         except json.JSONDecodeError:
+            pass
+        if isinstance(payload, str):
             return {
                 "content": payload,
                 "sender": "server",
@@ -46,21 +134,43 @@ def _extract_message(payload: Any) -> dict[str, Any]:
             "role": "assistant",
         }
 
-    return {
-        "content": payload.get("content") or payload.get("data") or "",
-        "sender": payload.get("sender") or payload.get("role") or "server",
-        "channel": payload.get("channel")
-        or payload.get("channel_id")
-        or "default-room",
-        "role": payload.get("role") or "assistant",
+    # Already normalized (exactly the canonical keys, all set): nothing to rebuild
+    if payload.keys() == _CANONICAL_KEYS and all(payload.values()):
+        return payload
+
+    get = payload.get
+    role = get("role")
+    message = {
+        "content": get("content") or get("data") or "",
+        "sender": get("sender") or role or "server",
+        "channel": get("channel") or get("channel_id") or "default-room",
+        "role": role or "assistant",
     }
+    if message_id := get("id"):
+        message["id"] = message_id
+    return message
+
 
+def _render_messages(
+    container: st.delta_generator.DeltaGenerator,
+) -> st.delta_generator.DeltaGenerator:
+    """Render the full chat history into the given placeholder.
 
-def _render_messages(container: st.delta_generator.DeltaGenerator) -> None:
-    """Render chat history into the given placeholder."""
+    Returns the inner container, so later messages can be appended with
+    `_render_new_messages` instead of re-rendering the whole history.
+    """
     container.empty()
-    with container.container():
-        for message in st.session_state.messages:
+    messages_container = container.container()
+    _render_new_messages(messages_container, st.session_state.messages)
+    return messages_container
+
+
+def _render_new_messages(
+    messages_container: st.delta_generator.DeltaGenerator, messages: list[dict[str, Any]]
+) -> None:
+    """Append messages below what is already rendered in the container."""
+    with messages_container:
+        for message in messages:
             with st.chat_message(message.get("role", "assistant")):
                 st.markdown(
                     f"**{message.get('sender', 'user')}**: {message.get('content', '')}"
@@ -68,7 +178,42 @@ def _render_messages(container: st.delta_generator.DeltaGenerator) -> None:
 
 
 def _append_message(message: dict[str, Any]) -> None:
-    st.session_state.messages.append(message)
+    if _is_new(message):
+        st.session_state.messages.append(message)
+
+
+async def _read_frames(
+    websocket: aiohttp.ClientWebSocketResponse, inbox: asyncio.Queue
+) -> None:
+    """Parse inbound WebSocket frames into chat messages on inbox; None marks the end."""
+    try:
+        async for msg in websocket:
+            if st.session_state.get("disconnect_requested"):
+                await websocket.close()
+                break
+            if msg.type == aiohttp.WSMsgType.TEXT and not _may_be_json(msg.data):
+                # Plain text is shown verbatim without paying for a failed parse
+                inbox.put_nowait(_extract_message(msg.data))
+            elif msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                try:
+                    # json.loads takes str or UTF-8 bytes, so binary frames need no decoded copy
+                    payload = msg.json(loads=json.loads)
+                except (UnicodeDecodeError, TypeError, ValueError) as exc:
+                    # %-args are only formatted if DEBUG is on
+                    logger.debug("Received non-JSON message: %r (%s)", msg.data, exc)
+                    # Undecodable text is shown verbatim, undecodable binary as a marker
+                    is_text = msg.type == aiohttp.WSMsgType.TEXT
+                    payload = msg.data if is_text else _BINARY_MESSAGE
+
+                inbox.put_nowait(_extract_message(payload))
+            elif msg.type in (
+                aiohttp.WSMsgType.CLOSE,
+                aiohttp.WSMsgType.CLOSED,
+                aiohttp.WSMsgType.ERROR,
+            ):
+                break
+    finally:
+        inbox.put_nowait(None)
 
 
 async def _chat_consumer(
@@ -80,50 +225,37 @@ async def _chat_consumer(
     async with aiohttp.ClientSession(trust_env=True) as session:
         status_placeholder.subheader(f"Connecting to {WS_CONN}")
         try:
-            async with session.ws_connect(WS_CONN, heartbeat=20.0) as websocket:
+            async with session.ws_connect(
+                WS_CONN, heartbeat=20.0, max_msg_size=_MAX_WS_MESSAGE_SIZE, compress=0
+            ) as websocket:
                 st.session_state.ws_client = websocket
                 status_placeholder.subheader(f"Connected to: {WS_CONN}")
                 st.session_state.connected = True
+                # Replay history once; inbound messages are only appended below it
+                messages_container = _render_messages(messages_placeholder)
 
-                async for msg in websocket:
-                    if st.session_state.get("disconnect_requested"):
-                        await websocket.close()
-                        break
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        payload_raw = msg.data
-                        try:
-                            payload = json.loads(payload_raw)
-                        except (TypeError, ValueError) as exc:
-                            payload = payload_raw
-                            logger.info(f"Received message: {payload}")
-                            logger.exception(exc)
-
-                        parsed = _extract_message(payload)
-                        _append_message(parsed)
-                        _render_messages(messages_placeholder)
-                    elif msg.type == aiohttp.WSMsgType.BINARY:
-                        try:
-                            decoded = msg.data.decode("utf-8")
-                            payload = json.loads(decoded)
-                        except (UnicodeDecodeError, TypeError, ValueError) as exc:
-                            logger.info(f"Received message: {payload}")
-                            logger.exception(exc)
-                            payload = {
-                                "content": "<binary>",
-                                "sender": "server",
-                                "channel": "default-room",
-                                "role": "assistant",
-                            }
-
-                        parsed = _extract_message(payload)
-                        _append_message(parsed)
-                        _render_messages(messages_placeholder)
-                    elif msg.type in (
-                        aiohttp.WSMsgType.CLOSE,
-                        aiohttp.WSMsgType.CLOSED,
-                        aiohttp.WSMsgType.ERROR,
-                    ):
-                        break
+                # The reader parses every frame already buffered before yielding, so a burst
+                # lands in the inbox together and is rendered once instead of once per frame
+                inbox: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+                reader = asyncio.create_task(_read_frames(websocket, inbox))
+                try:
+                    finished = False
+                    while not finished:
+                        batch = [await inbox.get()]
+                        while not inbox.empty():
+                            batch.append(inbox.get_nowait())
+                        finished = batch[-1] is None
+                        messages = [
+                            message
+                            for message in batch
+                            if message is not None and _is_new(message)
+                        ]
+                        if messages:
+                            st.session_state.messages.extend(messages)
+                            _render_new_messages(messages_container, messages)
+                finally:
+                    reader.cancel()  # no-op once the reader has finished on its own
+                await reader  # surface any error raised while reading
         except Exception as exc:
             status_placeholder.write(f"WebSocket error: {exc}")
             logger.exception(exc)
@@ -150,7 +282,8 @@ messages_placeholder = st.empty()
 
 with st.sidebar:
     st.header("Connection")
-    display_name = st.text_input("Display name", value=str(uuid4()).split("-")[0])
+    # A fresh default per rerun would change the widget's identity and reset its input
+    display_name = st.text_input("Display name", value=st.session_state.default_display_name)
     channel = st.text_input("Channel", value="default-room")
     connect_clicked = st.button("Connect to WS Server", type="primary")
     disconnect_clicked = st.button("Disconnect", type="secondary")
@@ -165,7 +298,7 @@ with st.sidebar:
         st.session_state.disconnect_requested = True
         st.session_state.connected = False
         st.session_state.channel_id = None
-        st.session_state.messages = []
+        _set_history()
         ws_client = st.session_state.get("ws_client")
         if ws_client is not None:
             with suppress(Exception):
@@ -182,11 +315,16 @@ if prompt := st.chat_input("Type a message..."):
         content=prompt,
         content_type="txt",
     )
-    payload = message.model_dump()
-    _append_message(payload)
+    # Serialize once for the wire; the model's own field dict (flat, never mutated here)
+    # goes to session state without a model_dump() copy
+    body = message.model_dump_json()
+    _append_message(message.__dict__)
     _render_messages(messages_placeholder)
-    resp = requests.post(
-        f"{API_BASE_URL}/channels/{st.session_state.channel_id}/messages", json=payload
+    resp = _http_session().post(
+        f"{API_BASE_URL}/channels/{st.session_state.channel_id}/messages",
+        data=body,
+        headers=_JSON_HEADERS,
+        timeout=_HTTP_TIMEOUT,
     )
     if resp.status_code != 200:
         st.error(f"Failed to send message: {resp.text}")
@@ -195,16 +333,17 @@ if prompt := st.chat_input("Type a message..."):
 
 if st.session_state.get("connect_requested"):
     st.session_state.channel_id = channel
-    resp = requests.get(
-        f"{API_BASE_URL}/channels/{st.session_state.channel_id}/messages"
+    resp = _http_session().get(
+        f"{API_BASE_URL}/channels/{st.session_state.channel_id}/messages",
+        timeout=_HTTP_TIMEOUT,
     )
     resp.raise_for_status()
-    st.session_state.messages = [
+    _set_history(
         {"role": message["role"], "content": message["content"], "id": message["id"]}
         for message in resp.json()
-    ]
-    asyncio.run(_chat_consumer(status, messages_placeholder))
+    )
+    asyncio.run(_chat_consumer(status, messages_placeholder), loop_factory=_LOOP_FACTORY)
 elif not st.session_state.connected:
     st.session_state.channel_id = None
-    st.session_state.messages = []
+    _set_history()
     status.subheader("Disconnected.")
@@ -58,10 +58,18 @@ settings = ConsumerSettings()
 
 
 def _resolve_api_base() -> str | None:
-    """Resolve the REST API base URL Fetching SSM"""
+    """Resolve the REST API base URL, from APIGW_REST_API_ID or else by fetching SSM"""
     # noinspection HttpUrlsUsage
     URL_FORMAT = "http://{FQDN}:4566/_aws/execute-api/{ID}/{STAGE}/"
 
+    # A configured API id needs no SSM round trip (nor an SSM client) at startup
+    if settings.apigw_rest_api_id:
+        return URL_FORMAT.format(
+            FQDN=settings.localstack_dns,
+            ID=settings.apigw_rest_api_id,
+            STAGE=settings.apigw_stage,
+        )
+
     # Request api gateway id from an SSM parameter
     ssm = boto3.client(
         "ssm",
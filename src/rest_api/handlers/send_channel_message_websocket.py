@@ -19,6 +19,9 @@ metrics = Metrics()
 logger = Logger()
 tracer = Tracer()
 
+# Bursts of broadcasts share one connections scan; new connections wait at most this long
+CONNECTIONS_CACHE_TTL = 2.0
+
 app = APIGatewayRestResolver(
     enable_validation=True,
     cors=cors_config,
@@ -30,7 +33,9 @@ def send_channel_message_websocket(
     channel_id: str, data: ChannelMessageCreateWebsocket
 ) -> ChannelMessageWebsocket:
     """Send a message to a channel via WebSocket broadcast."""
-    service = SendChannelMessageWebsocketService(repository=connections_repo)
+    service = SendChannelMessageWebsocketService(
+        repository=connections_repo, connections_cache_ttl=CONNECTIONS_CACHE_TTL
+    )
     result = service(channel_id=channel_id, message_data=data)
     return result
 
@@ -1,10 +1,17 @@
 from aws_lambda_powertools import Logger
+from pydantic import TypeAdapter
 
 from .base import BaseService
 from ..schemas import ChannelMessageResponse
 
 logger = Logger()
 
+# Only the attributes the response model reads are fetched from the table
+_MESSAGE_ATTRIBUTES = tuple(ChannelMessageResponse.model_fields)
+
+# Validates the whole history in one core-schema call instead of one call per message
+_MESSAGES_ADAPTER = TypeAdapter(list[ChannelMessageResponse])
+
 
 class GetChannelMessagesService(BaseService):
 
@@ -13,16 +20,11 @@ class GetChannelMessagesService(BaseService):
         """Get all messages for a channel."""
         logger.info(f"Getting messages for channel {channel_id}")
 
-        # In a real implementation, you'd query by channel_id (partition key)
-        # For now, we'll use get_list and filter
-        all_messages = self.repository.get_list()
-
-        # Filter by channel_id
-        messages = [msg for msg in all_messages if msg.get("channel_id") == channel_id]
-
-        # Sort by ts (timestamp)
-        messages.sort(key=lambda x: x.get("ts", 0))
+        # channel_id is the partition key, so DynamoDB returns only this channel, sorted by ts
+        messages = self.repository.query_by_partition(
+            channel_id, projection=_MESSAGE_ATTRIBUTES
+        )
 
         logger.info(f"Found {len(messages)} messages for channel {channel_id}")
 
-        return [ChannelMessageResponse.model_validate(msg) for msg in messages]
+        return _MESSAGES_ADAPTER.validate_python(messages)
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from aws_lambda_powertools import Logger
 
 from ..schemas import ChannelMessageCreate, ChannelMessageResponse
@@ -7,7 +9,12 @@ from .base import BaseService
 logger = Logger()
 
 
+@dataclass
 class SendChannelMessageService(BaseService):
+    """Service to store a channel message once per message id."""
+
+    # Secondary index keyed by the idempotency key, so a duplicate is found in one read
+    id_index_name: str = "MessageIdIndex"
 
     def __call__(
         self, channel_id: str, message_data: ChannelMessageCreate
@@ -17,20 +24,20 @@ class SendChannelMessageService(BaseService):
 
         repo_pk = self.repository.table_primary_key
         repo_id = self.repository.table_idempotency_key
-        message_pk = message_data.model_dump().get(repo_pk)
-        message_id = message_data.model_dump().get(repo_id)
-
-        # search existing
-        found = self.repository.get_by_key(
-            **{repo_pk: message_pk},  # channel
-            filter_attributes={repo_id: message_id},
-            raise_not_found=False,
-            limit=1,
+        # Validated once; the response model is the stored event schema, so it is returned as-is
+        message = ChannelMessageResponse(channel_id=channel_id, **message_data.model_dump())
+        item = message.model_dump()
+        message_pk = item.get(repo_pk)
+        message_id = item.get(repo_id)
+
+        # search existing by id, rather than reading the whole channel partition
+        found = self.repository.search_in_secondary_index(
+            index_name=self.id_index_name, field=repo_id, value=message_id
         )
-        if found:
+        if found and found.get(repo_pk) == message_pk:
             logger.info(f"Duplicate message {message_id}, returning existing")
             return ChannelMessageResponse.model_validate(found)
 
-        created = self.repository.create(item=message_data.model_dump())
+        self.repository.create(item=item)
         logger.info(f"Created message {message_id}")
-        return ChannelMessageResponse.model_validate(created)
+        return message
@@ -1,10 +1,10 @@
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
-import boto3
 from aws_lambda_powertools import Logger
-from botocore.exceptions import ClientError
 
+from commons.apigateway import get_apigw_client, post_to_connections
 from commons.dynamodb.exceptions import RepositoryError
 from rest_api.schemas import (
     ChannelMessageCreateWebsocket,
@@ -16,58 +16,65 @@ from .base import BaseService
 
 logger = Logger()
 
+# Connection lists read per repository: id -> (repository, expires_at, connections)
+_CONNECTIONS_CACHE: dict[int, tuple[Any, float, list[dict]]] = {}
+
 
 @dataclass
 class SendChannelMessageWebsocketService(BaseService):
     """Service to broadcast channel messages to all WebSocket connections."""
 
+    # Seconds a connection list is reused by later broadcasts (0 disables the cache)
+    connections_cache_ttl: float = 0
     _apigw_client: Any = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
+        super().__post_init__()
         if self._apigw_client is None:
-            self._apigw_client = boto3.client("apigatewaymanagementapi")
+            self._apigw_client = get_apigw_client()
 
     def _load_connections(self) -> list[dict]:
+        cache_key = id(self.repository)
+        if self.connections_cache_ttl:
+            cached = _CONNECTIONS_CACHE.get(cache_key)
+            # The cached repository reference also guards against a reused id()
+            if cached and cached[0] is self.repository and time.monotonic() < cached[1]:
+                return cached[2]
+
         try:
-            return self.repository.get_list()
+            connections = self.repository.get_list()
         except RepositoryError as err:
             logger.error(
                 "Failed to retrieve connections", error=str(err), exc_info=True
             )
             raise
 
-    def _broadcast(self, payload: str, connection_ids: list[str]) -> None:
-        stale_connections: list[str] = []
-        failed_connections: list[str] = []
+        if self.connections_cache_ttl:
+            expires_at = time.monotonic() + self.connections_cache_ttl
+            _CONNECTIONS_CACHE[cache_key] = (self.repository, expires_at, connections)
+        return connections
 
-        for connection_id in connection_ids:
-            try:
-                self._apigw_client.post_to_connection(
-                    ConnectionId=connection_id, Data=payload
-                )
-            except ClientError as exc:
-                error_code: str | None = exc.response.get("Error", {}).get("Code")
-                if error_code == "GoneException":
-                    stale_connections.append(connection_id)
-                else:
-                    failed_connections.append(connection_id)
-                    logger.error(
-                        "Failed to send message to connection",
-                        connection_id=connection_id,
-                        error=str(exc),
-                        exc_info=True,
-                    )
-
-        for stale_id in stale_connections:
+    def _broadcast(self, payload: bytes, connection_ids: list[str]) -> None:
+        stale_connections, failed_connections = post_to_connections(
+            self._apigw_client, connection_ids, payload
+        )
+
+        if stale_connections:
+            _CONNECTIONS_CACHE.pop(id(self.repository), None)
+            logger.warning(
+                "Pruning stale WebSocket connections",
+                stale_connection_count=len(stale_connections),
+                stale_connections=stale_connections,
+            )
             try:
-                logger.warning(
-                    "Pruning stale WebSocket connection", connection_id=stale_id
+                # One BatchWriteItem per 25 connections instead of a DeleteItem each
+                self.repository.batch_delete(
+                    {"connectionId": stale_id} for stale_id in stale_connections
                 )
-                self.repository.delete(connectionId=stale_id)
             except RepositoryError as err:
                 logger.error(
-                    "Failed to prune stale connection",
-                    connection_id=stale_id,
+                    "Failed to prune stale connections",
+                    stale_connections=stale_connections,
                     error=str(err),
                     exc_info=True,
                 )
@@ -94,7 +101,8 @@ class SendChannelMessageWebsocketService(BaseService):
             role=message_data.role,
         )
 
-        payload = message.model_dump_json(by_alias=True)
+        # Encoded once here rather than by botocore on each of the N posts
+        payload = message.model_dump_json(by_alias=True).encode()
 
         connections = self._load_connections()
         connection_ids = [
@@ -12,6 +12,7 @@ from aws_lambda_powertools.utilities.idempotency import (
 )
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
+from commons.dal.dynamodb_repository import BOTO_CONFIG
 from commons.repositories import chat_events_repository
 from commons.schemas import ChatEventMessage
 
@@ -26,6 +27,9 @@ class Settings(CommonRepositoriesSettings):
 
 settings = Settings()
 
+# Stateless, so one instance serves every stream record of every warm invocation
+_DESERIALIZER = TypeDeserializer()
+
 
 metrics = Metrics()
 logger = Logger()
@@ -35,6 +39,7 @@ persistence_layer = DynamoDBPersistenceLayer(
     table_name=settings.agent_idempotency_table_name,
     key_attr="id",
     expiry_attr="expiration",
+    boto_config=BOTO_CONFIG,  # keep-alive pooled connections, like the repositories
 )
 
 idempotency_config = IdempotencyConfig(
@@ -55,8 +60,14 @@ def generate_ai_response(user_message: str) -> str:
     persistence_store=persistence_layer,
     config=idempotency_config,
 )
-def process_user_message(record: Dict[str, Any]) -> None:
-    """Process a user message from DynamoDB Stream and generate an AI response."""
+def process_user_message(record: Dict[str, Any]) -> Dict[str, Any] | None:
+    """
+    Process a user message from DynamoDB Stream and generate an AI response.
+
+    Returns the AI response item for the handler to write, or None if the record is
+    skipped. The idempotency layer stores the item, so a retried record yields the
+    same item (same id and ts) and rewriting it is harmless.
+    """
     try:
         # DynamoDB Stream records have 'dynamodb' key with 'NewImage' for inserts
         if record.get("eventName") != "INSERT":
@@ -69,9 +80,8 @@ def process_user_message(record: Dict[str, Any]) -> None:
             return
 
         # Validate and parse message
-        ddb_deserializer = TypeDeserializer()
         try:
-            deserialized = {k: ddb_deserializer.deserialize(v) for k, v in new_image.items()}
+            deserialized = {k: _DESERIALIZER.deserialize(v) for k, v in new_image.items()}
             message = ChatEventMessage(**deserialized)
         except Exception as e:
             logger.error(f"Failed to parse message: {e}", exc_info=True)
@@ -95,8 +105,8 @@ def process_user_message(record: Dict[str, Any]) -> None:
             content=ai_content,
             content_type="text",
         )
-        chat_events_repository.create(item=chat_event.model_dump())
         logger.info(f"✓ Generated AI response for channel {message.channel_id}")
+        return chat_event.model_dump()
     except Exception as e:
         logger.error(f"Error processing user message: {e}", exc_info=True)
         raise
@@ -110,12 +120,20 @@ def handler(event: DynamoDBStreamEvent, context: LambdaContext):
     """AWS Lambda handler for DynamoDB Stream events."""
     logger.info(f"Received DynamoDB stream event with {len(event.get('Records', []))} records")
 
+    responses = []
     for record in event.get("Records", []):
         try:
-            process_user_message(record=record)  # Must use keyword argument for idempotency
+            item = process_user_message(record=record)  # Must use keyword argument for idempotency
         except Exception as e:
             logger.error(f"Failed to process record: {e}", exc_info=True)
             # Re-raise to trigger Lambda retry
             raise
+        if item:
+            responses.append(item)
+
+    # One BatchWriteItem per 25 responses instead of a PutItem per record
+    if responses:
+        chat_events_repository.batch_create(responses)
+        logger.info(f"Wrote {len(responses)} AI responses")
 
     return {"statusCode": 200}
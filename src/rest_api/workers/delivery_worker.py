@@ -1,5 +1,7 @@
 """Delivery Worker: AWS Lambda handler for delivering messages to WebSocket clients."""
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Any
 
 import httpx
@@ -16,6 +18,7 @@ from aws_lambda_powertools.utilities.idempotency import (
 )
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
+from commons.dal.dynamodb_repository import BOTO_CONFIG
 from commons.repositories import (
     Settings as CommonRepositoriesSettings,
 )
@@ -39,11 +42,14 @@ class Settings(CommonRepositoriesSettings):
 
 settings = Settings()
 
+_DESERIALIZER = TypeDeserializer()
+
 
 persistence_layer = DynamoDBPersistenceLayer(
     table_name=settings.delivery_idempotency_table_name,
     key_attr="id",
     expiry_attr="expiration",
+    boto_config=BOTO_CONFIG,
 )
 
 idempotency_config = IdempotencyConfig(
@@ -69,18 +75,30 @@ else:
     )
 
 
+# Channels delivered at once; records within one channel are always sent in order
+MAX_DELIVERY_WORKERS = 32
+
+
+def _new_http_client() -> httpx.Client:
+    return httpx.Client(
+        timeout=20.0,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+
+
 def _build_endpoint_url(channel_id: str) -> str:
     endpoint = settings.rest_api_endpoint.format(channel=channel_id)
     return f"{API_URL.rstrip('/')}/{endpoint.lstrip('/')}"
 
 
-async def _post_message(message: ChatEventMessage) -> None:
+def _post_message(message: ChatEventMessage, client: httpx.Client | None = None) -> None:
     url = _build_endpoint_url(channel_id=message.channel_id)
     payload = message.model_dump(by_alias=True)
 
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            response = await client.post(url, json=payload)
+        # Outside a handler run (e.g. a direct call) a one-off client is used
+        with nullcontext(client) if client else _new_http_client() as http_client:
+            response = http_client.post(url, json=payload)
             response.raise_for_status()
         logger.info(
             "Delivered message via REST", url=url, channel_id=message.channel_id
@@ -104,7 +122,7 @@ async def _post_message(message: ChatEventMessage) -> None:
     persistence_store=persistence_layer,
     config=idempotency_config,
 )
-async def deliver_message(record: dict[str, Any]) -> None:
+def deliver_message(record: dict[str, Any], client: httpx.Client | None = None) -> None:
     """Send a message to WebSocket clients."""
     # Only process INSERT events (new messages)
     if record.get("eventName") != "INSERT":
@@ -117,10 +135,9 @@ async def deliver_message(record: dict[str, Any]) -> None:
         return
 
     # Validate and parse message
-    ddb_deserializer = TypeDeserializer()
     try:
         deserialized = {
-            k: ddb_deserializer.deserialize(v) for k, v in new_image.items()
+            k: _DESERIALIZER.deserialize(v) for k, v in new_image.items()
         }
         message = ChatEventMessage(**deserialized)
     except Exception as e:
@@ -128,27 +145,47 @@ async def deliver_message(record: dict[str, Any]) -> None:
         return
 
     logger.info(f"Delivering message to channel {message.channel_id}")
-    await _post_message(message=message)
+    _post_message(message=message, client=client)
+
+
+def _deliver_in_order(client: httpx.Client, records: list[dict[str, Any]]) -> None:
+    for record in records:
+        deliver_message(record=record, client=client)  # Must use keyword argument for idempotency
 
 
 @event_source(data_class=DynamoDBStreamEvent)
 @logger.inject_lambda_context()
 @tracer.capture_lambda_handler
 @metrics.log_metrics(capture_cold_start_metric=True)
-async def handler(event: DynamoDBStreamEvent, context: LambdaContext):
+def handler(event: DynamoDBStreamEvent, context: LambdaContext):
     """AWS Lambda handler for DynamoDB Stream events."""
     logger.info(
         f"Received DynamoDB stream event with {len(event.get('Records', []))} records"
     )
 
+    # Channels are delivered concurrently; records of one channel stay in stream order
+    channels: dict[Any, list[dict[str, Any]]] = {}
     for record in event.get("Records", []):
-        try:
-            await deliver_message(
-                record=record
-            )  # Must use keyword argument for idempotency
-        except Exception as e:
-            logger.error(f"Failed to deliver record: {e}", exc_info=True)
-            # Re-raise to trigger Lambda retry
-            raise
+        new_image = record.get("dynamodb", {}).get("NewImage", {})
+        channel = new_image.get("channel_id", {}).get("S")
+        channels.setdefault(channel, []).append(record)
+
+    if not channels:
+        return {"statusCode": 200}
+
+    # The httpx client is thread-safe, so every channel shares its connection pool
+    with _new_http_client() as client, ThreadPoolExecutor(
+        max_workers=min(MAX_DELIVERY_WORKERS, len(channels))
+    ) as executor:
+        futures = [
+            executor.submit(_deliver_in_order, client, records) for records in channels.values()
+        ]
+    errors = [error for future in futures if (error := future.exception())]
+    for error in errors:
+        logger.error(f"Failed to deliver record: {error}", exc_info=error)
+    if errors:
+        # Re-raise to trigger Lambda retry; records delivered before the failure
+        # completed their idempotency record and are skipped on the retry
+        raise errors[0]
 
     return {"statusCode": 200}
@@ -1,13 +1,11 @@
 import json
-import os
 from typing import Any, Dict, List
 
-import boto3
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.utilities.parser import event_parser
 from aws_lambda_powertools.utilities.parser.models import APIGatewayWebSocketMessageEventModel
-from botocore.exceptions import ClientError
 
+from commons.apigateway import get_apigw_client, post_to_connections
 from commons.dynamodb.exceptions import RepositoryError
 from commons.repositories import connections_repo
 
@@ -26,7 +24,7 @@ def handler(event: APIGatewayWebSocketMessageEventModel, context: Any) -> Dict[s
     Returns:
         Response dictionary with statusCode and body
     """
-    apigw_management_api = boto3.client("apigatewaymanagementapi")
+    apigw_management_api = get_apigw_client()
 
     # Get all connection IDs using repository
     try:
@@ -41,31 +39,23 @@ def handler(event: APIGatewayWebSocketMessageEventModel, context: Any) -> Dict[s
     try:
         body = json.loads(event.body or "{}")
         post_data = body.get("data", "")
+        if isinstance(post_data, str):
+            post_data = post_data.encode()  # once, instead of by botocore on every post
     except json.JSONDecodeError:
         return {"statusCode": 400, "body": json.dumps({"error": "Invalid JSON in request body"})}
 
-    # Send message to all connections
-    failed_connections = []
-    for connection_id in connection_ids:
+    # Send message to all connections concurrently
+    stale_connections, failed_connections = post_to_connections(
+        apigw_management_api, connection_ids, post_data
+    )
+
+    # Handle stale connections (410 Gone)
+    if stale_connections:
+        logger.warning(f"Found {len(stale_connections)} stale connections, deleting")
         try:
-            apigw_management_api.post_to_connection(ConnectionId=connection_id, Data=post_data)
-        except ClientError as e:
-            # Handle stale connections (410 Gone)
-            error_code = e.response.get("Error", {}).get("Code")
-            if error_code == "GoneException":
-                logger.warning(f"Found stale connection, deleting {connection_id}")
-                try:
-                    connections_repo.delete(connectionId=connection_id)
-                except RepositoryError as delete_err:
-                    logger.error(
-                        f"Failed to delete stale connection {connection_id}: {delete_err}",
-                        exc_info=True,
-                    )
-            else:
-                logger.error(
-                    f"Failed to send message to connection {connection_id}: {e}", exc_info=True
-                )
-                failed_connections.append(connection_id)
+            connections_repo.batch_delete({"connectionId": cid} for cid in stale_connections)
+        except RepositoryError as delete_err:
+            logger.error(f"Failed to delete stale connections: {delete_err}", exc_info=True)
 
     if failed_connections:
         logger.warning(f"Failed to send to {len(failed_connections)} connections")
@@ -0,0 +1,96 @@
+"""Tests for the agent worker's stream handler and its single batch write of AI responses."""
+
+import os
+
+import pytest
+
+
+# Set default env vars early so the worker module can build its settings
+os.environ.setdefault("AGENT_IDEMPOTENCY_TABLE_NAME", "test_agent_idempotency")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("POWERTOOLS_TRACE_DISABLED", "true")
+os.environ.setdefault("POWERTOOLS_METRICS_NAMESPACE", "chat-service")
+
+from rest_api.workers import agent_worker
+
+
+@pytest.fixture
+def lambda_context():
+    """Create a minimal Lambda context object."""
+
+    class LambdaContext:
+        function_name = "test-agent-worker"
+        function_version = "$LATEST"
+        invoked_function_arn = "arn:aws:lambda:us-east-1:123456789012:function:test-agent-worker"
+        memory_limit_in_mb = 128
+        aws_request_id = "test-request-id"
+
+    return LambdaContext()
+
+
+@pytest.fixture
+def batch_writes(monkeypatch):
+    """Record each batch_create call instead of writing to DynamoDB."""
+    # The idempotency store is DynamoDB; these tests only cover the handler's write
+    monkeypatch.setenv("POWERTOOLS_IDEMPOTENCY_DISABLED", "true")
+    calls: list[list[dict]] = []
+    monkeypatch.setattr(agent_worker.chat_events_repository, "batch_create", calls.append)
+    return calls
+
+
+def _record(message_id: str, *, role: str = "user", event_name: str = "INSERT") -> dict:
+    return {
+        "eventName": event_name,
+        "dynamodb": {
+            "NewImage": {
+                "channel_id": {"S": "general"},
+                "id": {"S": message_id},
+                "sender_id": {"S": "alice"},
+                "role": {"S": role},
+                "content": {"S": f"question {message_id}"},
+                "content_type": {"S": "txt"},
+            }
+        },
+    }
+
+
+def test_handler_writes_all_responses_in_one_batch(batch_writes, lambda_context):
+    records = [
+        _record("m-1"),
+        _record("m-2", event_name="MODIFY"),
+        _record("m-3", role="assistant"),
+        _record("m-4"),
+    ]
+
+    response = agent_worker.handler({"Records": records}, lambda_context)
+
+    assert response == {"statusCode": 200}
+    assert len(batch_writes) == 1
+    assert [item["content"] for item in batch_writes[0]] == [
+        "AI Response to: question m-1",
+        "AI Response to: question m-4",
+    ]
+    assert all(item["role"] == "assistant" for item in batch_writes[0])
+
+
+def test_handler_skips_the_write_when_every_record_is_skipped(batch_writes, lambda_context):
+    records = [_record("m-1", event_name="REMOVE"), _record("m-2", role="assistant")]
+
+    agent_worker.handler({"Records": records}, lambda_context)
+
+    assert batch_writes == []
+
+
+def test_handler_writes_nothing_when_a_record_fails(batch_writes, lambda_context, monkeypatch):
+    def generate_ai_response(user_message: str) -> str:
+        if user_message.endswith("m-2"):
+            raise TimeoutError
+        return f"AI Response to: {user_message}"
+
+    monkeypatch.setattr(agent_worker, "generate_ai_response", generate_ai_response)
+    records = [_record("m-1"), _record("m-2"), _record("m-3")]
+
+    with pytest.raises(TimeoutError):
+        agent_worker.handler({"Records": records}, lambda_context)
+
+    assert batch_writes == []
@@ -15,10 +15,22 @@ class FakeRepo:
     def __init__(self, items=None):
         self.items = items or []
         self.table_hash_key = "channel_id"
+        self.table_primary_key = "channel_id"
+        self.table_idempotency_key = "id"
 
     def get_list(self):
         return list(self.items)
 
+    def query_by_partition(self, pk_value, *, sort_asc=True, limit=None, projection=None):
+        results = [item for item in self.items if item.get(self.table_hash_key) == pk_value]
+        results.sort(key=lambda item: item.get("ts", 0), reverse=not sort_asc)
+        if projection:
+            results = [{name: item[name] for name in projection if name in item} for item in results]
+        return results[:limit]
+
+    def search_in_secondary_index(self, *, index_name, field, value):
+        return next((item for item in self.items if item.get(field) == value), None)
+
     def create(self, item):
         self.items.append(item)
         return item
@@ -112,17 +124,43 @@ def test_send_channel_message_service_is_idempotent():
     assert first.content == second.content
 
 
+def test_send_channel_message_service_finds_duplicate_behind_other_messages():
+    message_repo = FakeRepo(
+        items=[
+            {"channel_id": "general", "ts": ts, "id": f"m-{ts}", "content": "other"}
+            for ts in range(1, 4)
+        ]
+    )
+    service = SendChannelMessageService(repository=message_repo)
+    payload = ChannelMessageCreate(id="test-123", content="Hello", role="user", sender_id="alice")
+
+    first = service(channel_id="general", message_data=payload)
+    message_repo.items.append(
+        {"channel_id": "general", "ts": 99, "id": "m-99", "content": "newer"}
+    )
+    second = service(channel_id="general", message_data=payload)
+
+    assert [item["id"] for item in message_repo.items].count("test-123") == 1
+    assert second.id == first.id
+    assert second.content == "Hello"
+
+
 class FakeConnectionsRepo:
     def __init__(self, connections=None):
         self.connections = connections or []
         self.deleted = []
+        self.list_calls = 0
 
     def get_list(self):
+        self.list_calls += 1
         return list(self.connections)
 
     def delete(self, connectionId: str):
         self.deleted.append(connectionId)
 
+    def batch_delete(self, keys):
+        self.deleted.extend(key["connectionId"] for key in keys)
+
 
 class FakeApigwClient:
     def __init__(self, gone_id: str | None = None):
@@ -172,3 +210,25 @@ def test_send_channel_message_websocket_service_prunes_stale_connections():
     service(channel_id="general", message_data=payload)
 
     assert connections_repo.deleted == ["gone-1"]
+
+
+def test_send_channel_message_websocket_service_caches_connections_until_pruned():
+    connections_repo = FakeConnectionsRepo(
+        connections=[{"connectionId": "c-1"}, {"connectionId": "gone-1"}]
+    )
+    client = FakeApigwClient(gone_id="gone-1")
+
+    service = SendChannelMessageWebsocketService(
+        repository=connections_repo, connections_cache_ttl=60
+    )
+    service._apigw_client = client
+
+    payload = ChannelMessageCreateWebsocket(id="m-1", content="hi", role="user", sender_id="u-1")
+    service(channel_id="general", message_data=payload)
+    service(channel_id="general", message_data=payload)
+    client.gone_id = None
+    service(channel_id="general", message_data=payload)
+    service(channel_id="general", message_data=payload)
+
+    # Pruning drops the cached list, so only broadcasts after a prune scan again
+    assert connections_repo.list_calls == 3
@@ -0,0 +1,113 @@
+"""Tests for the delivery worker's stream handler, with REST calls served by httpx.MockTransport."""
+
+import json
+import os
+import threading
+
+import httpx
+import pytest
+
+
+# Set default env vars early so the worker module can build its settings
+os.environ.setdefault("DELIVERY_IDEMPOTENCY_TABLE_NAME", "test_delivery_idempotency")
+os.environ.setdefault("REST_API_ID", "test-api")
+os.environ.setdefault("REST_API_STAGE", "test")
+os.environ.setdefault("REST_API_REGION", "us-east-1")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("POWERTOOLS_TRACE_DISABLED", "true")
+os.environ.setdefault("POWERTOOLS_METRICS_NAMESPACE", "chat-service")
+
+from rest_api.workers import delivery_worker
+
+
+@pytest.fixture
+def lambda_context():
+    """Create a minimal Lambda context object."""
+
+    class LambdaContext:
+        function_name = "test-delivery-worker"
+        function_version = "$LATEST"
+        invoked_function_arn = (
+            "arn:aws:lambda:us-east-1:123456789012:function:test-delivery-worker"
+        )
+        memory_limit_in_mb = 128
+        aws_request_id = "test-request-id"
+
+    return LambdaContext()
+
+
+@pytest.fixture
+def rest_api(monkeypatch):
+    """Serve the REST endpoint from a MockTransport; returns the delivered (channel, id) pairs."""
+    # The idempotency store is DynamoDB; these tests only cover the delivery fan-out
+    monkeypatch.setenv("POWERTOOLS_IDEMPOTENCY_DISABLED", "true")
+    delivered: list[tuple[str, str]] = []
+    failing: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        # The channel is the path segment before "messages/websocket"
+        channel_id = request.url.path.split("/")[-3]
+        if channel_id in failing:
+            return httpx.Response(failing[channel_id])
+        with lock:
+            delivered.append((channel_id, json.loads(request.content)["id"]))
+        return httpx.Response(200, json={})
+
+    monkeypatch.setattr(
+        delivery_worker,
+        "_new_http_client",
+        lambda: httpx.Client(transport=httpx.MockTransport(handle)),
+    )
+    return delivered, failing
+
+
+def _record(channel_id: str, message_id: str) -> dict:
+    return {
+        "eventName": "INSERT",
+        "dynamodb": {
+            "NewImage": {
+                "channel_id": {"S": channel_id},
+                "id": {"S": message_id},
+                "sender_id": {"S": "user-1"},
+                "role": {"S": "assistant"},
+                "content": {"S": f"message {message_id}"},
+                "content_type": {"S": "txt"},
+            }
+        },
+    }
+
+
+def test_handler_keeps_order_within_each_channel(rest_api, lambda_context):
+    delivered, _ = rest_api
+    records = [
+        _record("ch-a", "a-1"),
+        _record("ch-b", "b-1"),
+        _record("ch-a", "a-2"),
+        _record("ch-b", "b-2"),
+        _record("ch-a", "a-3"),
+    ]
+
+    response = delivery_worker.handler({"Records": records}, lambda_context)
+
+    assert response == {"statusCode": 200}
+    assert [mid for channel, mid in delivered if channel == "ch-a"] == ["a-1", "a-2", "a-3"]
+    assert [mid for channel, mid in delivered if channel == "ch-b"] == ["b-1", "b-2"]
+
+
+def test_handler_delivers_other_channels_and_reraises_first_error(rest_api, lambda_context):
+    delivered, failing = rest_api
+    failing.update({"ch-bad-1": 500, "ch-bad-2": 503})
+    records = [
+        _record("ch-bad-1", "x-1"),
+        _record("ch-ok", "ok-1"),
+        _record("ch-bad-2", "y-1"),
+        _record("ch-ok", "ok-2"),
+    ]
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        delivery_worker.handler({"Records": records}, lambda_context)
+
+    # The error from the first channel in stream order is the one re-raised
+    assert exc_info.value.response.status_code == 500
+    assert delivered == [("ch-ok", "ok-1"), ("ch-ok", "ok-2")]
@@ -0,0 +1,203 @@
+import boto3
+import pytest
+from boto3.dynamodb.conditions import Attr
+from moto import mock_aws
+
+from commons.dal.dynamodb_repository import (
+    BATCH_MAX_ATTEMPTS,
+    DynamoDBRepository,
+    serialize_item,
+)
+from commons.dynamodb.exceptions import ConflictError, RepositoryError
+
+
+# Fake credentials must be in place before the repository fixture builds its clients
+pytestmark = pytest.mark.usefixtures("aws_credentials")
+
+
+@pytest.fixture
+def repository():
+    with mock_aws():
+        boto3.client("dynamodb", region_name="us-east-1").create_table(
+            TableName="messages-test",
+            KeySchema=[
+                {"AttributeName": "channel_id", "KeyType": "HASH"},
+                {"AttributeName": "ts", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "channel_id", "AttributeType": "S"},
+                {"AttributeName": "ts", "AttributeType": "N"},
+                {"AttributeName": "id", "AttributeType": "S"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "MessageIdIndex",
+                    "KeySchema": [{"AttributeName": "id", "KeyType": "HASH"}],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield DynamoDBRepository(
+            table_name="messages-test", table_hash_key="channel_id", table_sort_key="ts"
+        )
+
+
+def test_get_by_key_projection_returns_only_requested_attributes(repository):
+    repository.create({"channel_id": "general", "ts": 1, "content": "hi", "name": "bob"})
+
+    item = repository.get_by_key(channel_id="general", ts=1, projection=["content", "name"])
+    queried = repository.get_by_key(channel_id="general", projection=("name",))
+
+    assert item == {"content": "hi", "name": "bob"}
+    assert queried == {"name": "bob"}
+
+
+def test_get_by_key_cache_is_invalidated_on_update(repository):
+    repository.cache_ttl = 60
+    repository.create({"channel_id": "general", "ts": 1, "content": "hi"})
+    assert repository.get_by_key(channel_id="general", ts=1)["content"] == "hi"
+
+    repository.table.update_item(
+        Key={"channel_id": "general", "ts": 1},
+        UpdateExpression="SET content = :c",
+        ExpressionAttributeValues={":c": "changed elsewhere"},
+    )
+    assert repository.get_by_key(channel_id="general", ts=1)["content"] == "hi"
+
+    repository.update({"content": "edited"}, channel_id="general", ts=1)
+    assert repository.get_by_key(channel_id="general", ts=1)["content"] == "edited"
+
+
+def test_get_by_key_cached_item_is_not_shared_with_callers(repository):
+    repository.cache_ttl = 60
+    repository.create({"channel_id": "general", "ts": 1, "content": "hi"})
+
+    repository.get_by_key(channel_id="general", ts=1)["content"] = "mutated"
+    repository.get_by_key(channel_id="general", ts=1)["content"] = "mutated"
+
+    assert repository.get_by_key(channel_id="general", ts=1)["content"] == "hi"
+
+
+def test_secondary_index_lookups(repository):
+    repository.create({"channel_id": "general", "ts": 1, "id": "m1"})
+    repository.create({"channel_id": "random", "ts": 2, "id": "m1"})
+
+    first = repository.search_in_secondary_index(
+        index_name="MessageIdIndex", field="id", value="m1"
+    )
+    every = list(
+        repository.iter_secondary_index(index_name="MessageIdIndex", field="id", value="m1")
+    )
+
+    assert first["id"] == "m1"
+    assert sorted(item["channel_id"] for item in every) == ["general", "random"]
+
+
+def test_get_many_fetches_existing_items_across_batches(repository):
+    repository.batch_create({"channel_id": "general", "ts": ts} for ts in range(150))
+
+    keys = [{"channel_id": "general", "ts": ts} for ts in range(220)]
+    items = repository.get_many(keys + keys[:3])
+
+    assert sorted(item["ts"] for item in items) == list(range(150))
+
+
+def test_create_raw_and_unique(repository):
+    item = serialize_item({"channel_id": "general", "ts": 1, "content": "hi"})
+
+    repository.create(item, raw=True, unique=True)
+
+    assert repository.get_by_key(channel_id="general", ts=1)["content"] == "hi"
+    with pytest.raises(ConflictError):
+        repository.create({"channel_id": "general", "ts": 1, "content": "dup"}, unique=True)
+    with pytest.raises(ConflictError):
+        repository.create(item, raw=True, unique=True)
+
+
+def test_raw_reads_return_attribute_values(repository):
+    repository.create({"channel_id": "general", "ts": 1, "content": "hi", "role": "user"})
+
+    scanned = repository.get_list(raw=True)
+    queried = repository.get_by_key(
+        channel_id="general", filter_attributes={"role": "user"}, raw=True
+    )
+    fetched = repository.get_by_key(channel_id="general", ts=1, projection=("content",), raw=True)
+
+    assert scanned[0]["content"] == {"S": "hi"}
+    assert queried["ts"] == {"N": "1"}
+    assert fetched == {"content": {"S": "hi"}}
+
+
+def test_conditional_update_and_delete(repository):
+    repository.create({"channel_id": "general", "ts": 1, "content": "hi"})
+
+    with pytest.raises(ConflictError):
+        repository.update(
+            {"content": "edited"}, condition=Attr("content").eq("other"), channel_id="general", ts=1
+        )
+    with pytest.raises(ConflictError):
+        repository.delete(condition=Attr("content").eq("other"), channel_id="general", ts=1)
+    repository.delete(condition=Attr("content").eq("hi"), channel_id="general", ts=1)
+
+    assert repository.get_by_key(channel_id="general", ts=1, raise_not_found=False) is None
+
+
+def test_query_by_partition_returns_one_channel_sorted(repository):
+    repository.batch_create({"channel_id": "general", "ts": ts} for ts in (3, 1, 2))
+    repository.create({"channel_id": "random", "ts": 0})
+
+    ascending = repository.query_by_partition("general")
+    latest = repository.query_by_partition("general", sort_asc=False, limit=2)
+
+    assert [item["ts"] for item in ascending] == [1, 2, 3]
+    assert [item["ts"] for item in latest] == [3, 2]
+
+
+def test_query_by_partition_projection(repository):
+    repository.create({"channel_id": "general", "ts": 1, "content": "hi", "metadata": {"a": 1}})
+
+    items = repository.query_by_partition("general", projection=["ts", "content"])
+
+    assert items == [{"ts": 1, "content": "hi"}]
+
+
+def test_batch_delete_tolerates_repeated_keys(repository):
+    repository.batch_create({"channel_id": "general", "ts": ts} for ts in range(3))
+    first, second = ({"channel_id": "general", "ts": ts} for ts in range(2))
+
+    repository.batch_delete([first, second, first])
+
+    assert [item["ts"] for item in repository.query_by_partition("general")] == [2]
+
+
+class ThrottlingClient:
+    """Low-level client stub that leaves the first item of each request unprocessed."""
+
+    def __init__(self, throttled_calls):
+        self.throttled_calls = throttled_calls
+        self.requests = []
+
+    def batch_write_item(self, RequestItems):
+        (table_name, requests), = RequestItems.items()
+        self.requests.append(requests)
+        if len(self.requests) > self.throttled_calls:
+            return {"UnprocessedItems": {}}
+        return {"UnprocessedItems": {table_name: requests[:1]}}
+
+
+def test_batch_create_resends_unprocessed_items(repository, monkeypatch):
+    monkeypatch.setattr("commons.dal.dynamodb_repository._backoff", lambda _attempt: None)
+    client = repository.__dict__["_client"] = ThrottlingClient(throttled_calls=2)
+
+    repository.batch_create({"channel_id": "general", "ts": ts} for ts in range(3))
+
+    assert [len(requests) for requests in client.requests] == [3, 1, 1]
+
+
+def test_batch_create_gives_up_on_persistent_throttling(repository, monkeypatch):
+    monkeypatch.setattr("commons.dal.dynamodb_repository._backoff", lambda _attempt: None)
+    repository.__dict__["_client"] = ThrottlingClient(throttled_calls=BATCH_MAX_ATTEMPTS)
+
+    with pytest.raises(RepositoryError):
+        repository.batch_create([{"channel_id": "general", "ts": 1}])
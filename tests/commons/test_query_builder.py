@@ -0,0 +1,46 @@
+from commons.postgresql.query_builder import QueryBuilder
+
+
+def make_builder() -> QueryBuilder:
+    return QueryBuilder(
+        select_columns=["m.id", "m.content"],
+        from_=["messages m"],
+        join=[("LEFT", "channels c", "c.id = m.channel_id")],
+        group_by=["m.id"],
+        order_by=["m.ts"],
+    )
+
+
+def test_count_query_is_built_from_count_select():
+    builder = make_builder()
+
+    sql, sql_count, params = builder.build_sql_with_count_query({"channel_id": "general"})
+
+    assert sql_count.startswith("SELECT COUNT(*) as total")
+    assert sql_count.count("JOIN") == 1
+    assert sql_count.count("WHERE") == 1
+    assert "ORDER BY" not in sql_count
+    assert sql.count("WHERE") == 1
+    assert params == {"channel_id": "general"}
+
+
+def test_compiled_sql_is_reused_for_same_params_shape():
+    builder = make_builder()
+
+    first, _ = builder.build_sql_query({"channel_id": "a", "role": None}, limit=10)
+    second, params = builder.build_sql_query({"channel_id": "b"}, limit=20, offset=5)
+
+    assert first is second
+    assert "role" not in first
+    assert params == {"channel_id": "b", "limit_param": 20, "offset_param": 5}
+
+
+def test_builder_without_search_maps_builds_unfiltered_sql():
+    builder = QueryBuilder(
+        select_columns=["m.id"], from_=["messages m"], search_aliases=None, search_operators=None
+    )
+
+    sql, params = builder.build_sql_query(None)
+
+    assert "WHERE" not in sql
+    assert params == {}
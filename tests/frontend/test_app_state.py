@@ -0,0 +1,96 @@
+import importlib
+import json
+
+import pytest
+
+
+pytest.importorskip("streamlit")
+pytest.importorskip("aiohttp")
+
+
+class _SessionState(dict):
+    """Attribute-style dict standing in for st.session_state."""
+
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+@pytest.fixture
+def app(monkeypatch):
+    # A configured API id keeps the module import from resolving it through SSM
+    monkeypatch.setenv("APIGW_REST_API_ID", "test-api")
+    module = importlib.import_module("frontend.app")
+    monkeypatch.setattr(module.st, "session_state", _SessionState())
+    module._set_history()
+    return module
+
+
+def test_extract_message_wraps_plain_text(app):
+    assert app._extract_message("hello") == {
+        "content": "hello",
+        "sender": "server",
+        "channel": "default-room",
+        "role": "assistant",
+    }
+
+
+def test_extract_message_keeps_unparseable_json_as_text(app):
+    assert app._extract_message("{not json")["content"] == "{not json"
+
+
+def test_extract_message_normalizes_json_payloads(app):
+    payload = json.dumps({"data": "hi", "channel_id": "room-1", "role": "user", "id": "m1"})
+
+    assert app._extract_message(payload) == {
+        "content": "hi",
+        "sender": "user",
+        "channel": "room-1",
+        "role": "user",
+        "id": "m1",
+    }
+
+
+@pytest.mark.parametrize("prefix", [" ", "\n", "\r\n\t "])
+def test_extract_message_parses_json_after_leading_whitespace(app, prefix):
+    payload = prefix + json.dumps({"content": "hi", "id": "m1"})
+
+    message = app._extract_message(payload)
+
+    assert message["content"] == "hi"
+    assert message["id"] == "m1"
+
+
+def test_extract_message_unquotes_json_string_literals(app):
+    assert app._extract_message('"hello"')["content"] == "hello"
+
+
+def test_extract_message_returns_canonical_messages_as_is(app):
+    message = {"content": "hi", "sender": "bob", "channel": "room-1", "role": "user"}
+
+    assert app._extract_message(message) is message
+
+
+def test_extract_message_stringifies_non_dict_json(app):
+    assert app._extract_message("[1, 2]")["content"] == "[1, 2]"
+
+
+def test_is_new_rejects_seen_ids_and_accepts_messages_without_id(app):
+    app._set_history([{"id": "m1", "content": "hi"}])
+
+    assert app._is_new({"id": "m1"}) is False
+    assert app._is_new({"id": "m2"}) is True
+    assert app._is_new({"id": "m2"}) is False
+    assert app._is_new({"content": "no id"}) is True
+
+
+def test_is_new_evicts_the_oldest_id_beyond_max_messages(app):
+    app._set_history({"id": f"m{i}"} for i in range(app._MAX_MESSAGES))
+
+    assert app._is_new({"id": "newest"}) is True
+
+    seen_ids = app.st.session_state.seen_ids
+    assert len(seen_ids) == app._MAX_MESSAGES
+    assert "m0" not in seen_ids
+    assert "m1" in seen_ids
+    # An evicted id is treated as new again, like its message leaving the history
+    assert app._is_new({"id": "m0"}) is True
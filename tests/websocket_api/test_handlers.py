@@ -19,6 +19,7 @@ os.environ.setdefault("TABLE_NAME", "test_connections")
 os.environ.setdefault("AWS_REGION", "us-east-1")
 os.environ.setdefault("DYNAMODB_ENDPOINT_URL", "http://localhost:4566")
 
+from commons.apigateway import get_apigw_client
 from websocket_api.onconnect.app import handler as onconnect_handler
 from websocket_api.ondisconnect.app import handler as ondisconnect_handler
 from websocket_api.sendmessage.app import handler as sendmessage_handler
@@ -170,6 +171,13 @@ class TestOnDisconnectHandler:
 class TestSendMessageHandler:
     """Tests for the sendmessage handler."""
 
+    @pytest.fixture(autouse=True)
+    def reset_apigw_clients(self):
+        """Drop API Gateway clients cached by other tests so each test sees its own mock."""
+        get_apigw_client.cache_clear()
+        yield
+        get_apigw_client.cache_clear()
+
     @mock_aws
     def test_send_message_success(self, set_env_vars, lambda_context):
         """Test successful message broadcast to all connections."""